@@ -3,9 +3,8 @@
 # See LICENSE.rst for details.
 
 import atexit
-import inspect
-import argparse
 import importlib
+from functools import lru_cache
 
 
 def get_choices(module_name):
@@ -14,6 +13,7 @@ def get_choices(module_name):
 
     :rtype: list
     """
+    import inspect
     try:
         module = importlib.import_module(module_name)
         if hasattr(module, '__all__'):
@@ -25,9 +25,11 @@ def get_choices(module_name):
         return []
 
 
+@lru_cache(maxsize=1)
 def get_supported_libraries():
     """
-    Get list of supported libraries for the parser.
+    Get list of supported libraries for the parser. The result is cached, and
+    should be treated as read-only.
 
     :rtype: list
     """
@@ -80,10 +82,13 @@ def get_interface_types():
     return get_choices('luma.core.interface.serial') + get_choices('luma.core.interface.parallel')
 
 
+@lru_cache(maxsize=1)
 def get_display_types():
     """
     Get ``dict`` containing available display types from available luma
-    sub-projects.
+    sub-projects. Enumerating the installed libraries involves a series of
+    module imports, so the result is cached: it is a pure function of the
+    installed environment, and should be treated as read-only.
 
     :rtype: dict
     """
@@ -272,6 +277,7 @@ def create_parser(description):
     """
     Create and return command-line argument parser.
     """
+    import argparse
     parser = argparse.ArgumentParser(description=description,
         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 
@@ -5,8 +5,6 @@
 import os
 import atexit
 from time import sleep
-from itertools import islice
-from PIL import Image
 
 from luma.core import mixin
 from luma.core.util import bytes_to_nibbles
@@ -255,23 +253,34 @@ class linux_framebuffer(device):
                     yield int(value)
 
     def __toRGB565(self, image):
-        for r, g, b in image.getdata():
-            yield g << 3 & 0xE0 | b >> 3
-            yield r & 0xF8 | g >> 5
+        rgb = image.tobytes()
+        frame = bytearray(len(rgb) // 3 * 2)
+        i = 0
+        for j in range(0, len(rgb), 3):
+            r, g, b = rgb[j:j + 3]
+            frame[i] = g << 3 & 0xE0 | b >> 3
+            frame[i + 1] = r & 0xF8 | g >> 5
+            i += 2
+        return bytes(frame)
 
     def __toRGB(self, image):
-        return iter(image.tobytes())
+        return image.tobytes()
 
     def __toBGR(self, image):
-        r, g, b = image.split()
-        return iter(Image.merge("RGB", (b, g, r)).tobytes())
+        # Swap the R and B planes with two strided slice assignments over
+        # the packed pixel data, rather than materializing three channel
+        # images with split/merge
+        frame = bytearray(image.tobytes())
+        frame[0::3], frame[2::3] = frame[2::3], frame[0::3]
+        return bytes(frame)
 
     def __toRGBA(self, image):
-        return iter(image.convert("RGBA").tobytes())
+        return image.convert("RGBA").tobytes()
 
     def __toBGRA(self, image):
-        r, g, b = image.split()
-        return iter(Image.merge("RGB", (b, g, r)).convert("RGBA").tobytes())
+        frame = bytearray(image.convert("RGBA").tobytes())
+        frame[0::4], frame[2::4] = frame[2::4], frame[0::4]
+        return bytes(frame)
 
     def cleanup(self):
         super(linux_framebuffer, self).cleanup()
@@ -296,13 +305,27 @@ class linux_framebuffer(device):
 
         for image, bounding_box in self.framebuffer.redraw(image):
             left, top, right, bottom = bounding_box
+            # memoryview slices are zero-copy windows onto the converted
+            # frame, so each row write avoids building an intermediate bytes
+            # object from a generator.
+            data = memoryview(self.__image_converter(image))
+
+            if left == 0 and right == self.width:
+                # A full-width segment occupies one contiguous run of the
+                # framebuffer, so it can land with a single seek and write
+                # rather than a syscall pair per row.
+                file_handle.seek(top * image_bytes_per_row)
+                file_handle.write(data)
+                continue
+
             segment_bytes_per_row = (right - left) * bytes_per_pixel
             left_offset = left * bytes_per_pixel
-            generator = self.__image_converter(image)
+            data_offset = 0
             for row_offset in range(left_offset + top * image_bytes_per_row,
                                     left_offset + bottom * image_bytes_per_row,
                                     image_bytes_per_row):
                 file_handle.seek(row_offset)
-                file_handle.write(bytes(islice(generator, segment_bytes_per_row)))
+                file_handle.write(data[data_offset:data_offset + segment_bytes_per_row])
+                data_offset += segment_bytes_per_row
 
         file_handle.flush()
@@ -7,7 +7,7 @@ Different implementation strategies for framebuffering
 """
 
 from math import sqrt
-from PIL import ImageChops, ImageDraw
+from PIL import ImageChops, ImageDraw, ImageStat
 
 
 class diff_to_previous(object):
@@ -33,13 +33,125 @@ class diff_to_previous(object):
         show the area that changed. This is obviously destructive for displaying
         the actual image, but intends to show where the tracked changes are.
     :type debug: boolean
+    :param full_refresh_ratio: When set (a value between 0 and 1), and the
+        changed segments cover at least that fraction of the image area, a
+        single full-frame redraw is emitted instead of the individual segment
+        differences: one large transfer is usually cheaper than many separate
+        ones once most of the screen has changed anyway. Defaults to ``None``
+        (always emit per-segment differences).
+    :type full_refresh_ratio: float
+    :param quiet_threshold: When set, frames whose mean per-channel
+        difference from the previous frame is below this value (in the range
+        0-255) are suppressed entirely. This avoids burning transfer
+        bandwidth on imperceptible changes, e.g. dithering noise; the changes
+        are not lost, but accumulate until they cross the threshold. Defaults
+        to ``None`` (render every change, however small).
+    :type quiet_threshold: float
+    :param scroll_detect: When set, checks whether the frame is simply the
+        previous frame shifted vertically (e.g. scrolling text) before
+        scanning segments. A detected scroll skips the per-segment diffing
+        entirely and emits one full-frame redraw, with the row shift recorded
+        in the :py:attr:`scroll_offset` attribute (negative for upward
+        movement) for consumers that can exploit it. Defaults to ``False``.
+    :type scroll_detect: boolean
+    :param merge_segments: When set, changed segments that are adjacent in
+        the grid are coalesced and emitted as one redraw covering their
+        combined bounding box. Fewer, larger transfers suit interfaces where
+        per-transfer setup dominates, at the cost of re-sending any unchanged
+        pixels falling inside the combined box. Defaults to ``False``.
+    :type merge_segments: boolean
     """
 
-    def __init__(self, num_segments=4, debug=False):
+    __slots__ = ['__debug', '__n', '__full_refresh_ratio', '__quiet_threshold',
+                 '__scroll_detect', '__merge_segments', 'scroll_offset',
+                 'prev_image', '__prev_bytes', '__segment_boxes',
+                 '__segment_boxes_size']
+
+    def __init__(self, num_segments=4, debug=False, full_refresh_ratio=None,
+                 quiet_threshold=None, scroll_detect=False, merge_segments=False):
         self.__debug = debug
         self.__n = int(sqrt(num_segments))
         assert num_segments >= 1 and num_segments == self.__n ** 2
+        self.__full_refresh_ratio = full_refresh_ratio
+        self.__quiet_threshold = quiet_threshold
+        self.__scroll_detect = scroll_detect
+        self.__merge_segments = merge_segments
+        self.scroll_offset = None
         self.prev_image = None
+        self.__prev_bytes = None
+        self.__segment_boxes = None
+        self.__segment_boxes_size = None
+
+    def __detect_vertical_scroll(self, image_bytes, image_height):
+        """
+        Determine whether ``image_bytes`` is the previous frame's pixel
+        buffer shifted by a whole number of rows, returning the shift (in
+        rows, negative for upward movement) or ``None``. The search and the
+        verification are both byte-string operations, so a scroll is
+        detected in a couple of C-level passes.
+        """
+        prev_bytes = self.__prev_bytes
+        row_length = len(image_bytes) // image_height
+        if row_length == 0 or len(prev_bytes) != len(image_bytes):
+            return None
+
+        candidates = []
+
+        # Content moved up: the new top row occurs further down in the
+        # previous frame, and everything above the scrolled-in rows matches.
+        position = prev_bytes.find(image_bytes[:row_length])
+        if position > 0 and position % row_length == 0 and \
+                image_bytes[:len(image_bytes) - position] == prev_bytes[position:]:
+            candidates.append(-(position // row_length))
+
+        # Content moved down: the previous top row occurs further down in
+        # the new frame.
+        position = image_bytes.find(prev_bytes[:row_length])
+        if position > 0 and position % row_length == 0 and \
+                prev_bytes[:len(prev_bytes) - position] == image_bytes[position:]:
+            candidates.append(position // row_length)
+
+        # A wrapped scroll matches in both directions; prefer the smaller
+        # movement as the likelier intent.
+        return min(candidates, key=abs) if candidates else None
+
+    def __merge_dirty_segments(self, dirty):
+        """
+        Coalesce dirty segments that are 4-adjacent in the segment grid into
+        single regions, returning the combined bounding boxes in row-major
+        order of each group's first dirty segment. ``dirty`` is a list of
+        ``(segment index, bounding box)`` tuples.
+        """
+        n = self.__n
+        parent = {index: index for index, _ in dirty}
+
+        def find(index):
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        for index, _ in dirty:
+            if index % n != 0 and (index - 1) in parent:
+                parent[find(index)] = find(index - 1)
+            if index >= n and (index - n) in parent:
+                parent[find(index)] = find(index - n)
+
+        merged = {}
+        for index, (left, top, right, bottom) in dirty:
+            root = find(index)
+            if root in merged:
+                l, t, r, b = merged[root]
+                merged[root] = (min(l, left), min(t, top), max(r, right), max(b, bottom))
+            else:
+                merged[root] = (left, top, right, bottom)
+
+        regions = []
+        for index, _ in dirty:
+            root = find(index)
+            if root in merged:
+                regions.append(merged.pop(root))
+        return regions
 
     def redraw(self, image):
         """
@@ -61,6 +173,7 @@ class diff_to_previous(object):
         assert segment_height * self.__n == image_height, "Total segment height does not cover full image height"
 
         changes = 0
+        image_bytes = image.tobytes()
 
         # Force a full redraw on the first frame
         if self.prev_image is None:
@@ -68,33 +181,94 @@ class diff_to_previous(object):
             yield image, (0, 0) + image.size
 
         else:
-            for y in range(0, image_height, segment_height):
-                for x in range(0, image_width, segment_width):
-                    bounding_box = (x, y, x + segment_width, y + segment_height)
-                    prev_segment = self.prev_image.crop(bounding_box)
-                    curr_segment = image.crop(bounding_box)
-                    segment_bounding_box = ImageChops.difference(prev_segment, curr_segment).getbbox()
-                    if segment_bounding_box is not None:
-                        changes += 1
-                        segment_bounding_box_from_origin = (
-                            x + segment_bounding_box[0],
-                            y + segment_bounding_box[1],
-                            x + segment_bounding_box[2],
-                            y + segment_bounding_box[3]
-                        )
-
-                        image_delta = curr_segment.crop(segment_bounding_box)
-
-                        if self.__debug:
-                            w, h = image_delta.size
-                            draw = ImageDraw.Draw(image_delta)
-                            draw.rectangle((0, 0, w - 1, h - 1), outline="red")
-                            del draw
-
-                        yield image_delta, segment_bounding_box_from_origin
+            # Cheap whole-frame comparison first: comparing the packed pixel
+            # buffers is a straight memcmp, so identical frames bail out
+            # before any difference image is built or segments are cropped.
+            # The previous frame's buffer is cached from the last redraw, so
+            # only the incoming image needs packing here.
+            # Reset before the short-circuit too, so a detected scroll is
+            # not still reported after a subsequent unchanged frame.
+            self.scroll_offset = None
+            if image_bytes == self.__prev_bytes:
+                return
+
+            if self.__scroll_detect:
+                self.scroll_offset = self.__detect_vertical_scroll(image_bytes, image_height)
+                if self.scroll_offset is not None:
+                    yield image, (0, 0) + image.size
+                    self.prev_image = image.copy()
+                    self.__prev_bytes = image_bytes
+                    return
+
+            # One full-frame difference image serves both the quiet-frame
+            # check and the per-segment scans below, instead of diffing each
+            # pair of segment crops separately.
+            difference = ImageChops.difference(self.prev_image, image)
+
+            if self.__quiet_threshold is not None:
+                if max(ImageStat.Stat(difference).mean) < self.__quiet_threshold:
+                    return
+
+            # The segment grid only depends on the image size, so compute the
+            # crop boxes once and reuse them until the size changes.
+            if self.__segment_boxes_size != image.size:
+                self.__segment_boxes = [
+                    (x, y, (x, y, x + segment_width, y + segment_height))
+                    for y in range(0, image_height, segment_height)
+                    for x in range(0, image_width, segment_width)
+                ]
+                self.__segment_boxes_size = image.size
+
+            global_bounding_box = difference.getbbox()
+            if global_bounding_box is None:
+                return
+            global_left, global_top, global_right, global_bottom = global_bounding_box
+
+            dirty = []
+            for index, (x, y, bounding_box) in enumerate(self.__segment_boxes):
+                # Segments entirely outside the overall changed region can be
+                # ruled out with four integer comparisons, skipping the crop
+                # and scan below.
+                if bounding_box[0] >= global_right or bounding_box[2] <= global_left or \
+                        bounding_box[1] >= global_bottom or bounding_box[3] <= global_top:
+                    continue
+
+                segment_bounding_box = difference.crop(bounding_box).getbbox()
+                if segment_bounding_box is not None:
+                    segment_bounding_box_from_origin = (
+                        x + segment_bounding_box[0],
+                        y + segment_bounding_box[1],
+                        x + segment_bounding_box[2],
+                        y + segment_bounding_box[3]
+                    )
+                    dirty.append((index, segment_bounding_box_from_origin))
+
+            if self.__full_refresh_ratio is not None and \
+                    len(dirty) * segment_width * segment_height >= \
+                    self.__full_refresh_ratio * image_width * image_height:
+                changes += 1
+                yield image, (0, 0) + image.size
+            else:
+                if self.__merge_segments:
+                    regions = self.__merge_dirty_segments(dirty)
+                else:
+                    regions = [bounding_box for index, bounding_box in dirty]
+
+                for bounding_box in regions:
+                    image_delta = image.crop(bounding_box)
+
+                    if self.__debug:
+                        w, h = image_delta.size
+                        draw = ImageDraw.Draw(image_delta)
+                        draw.rectangle((0, 0, w - 1, h - 1), outline="red")
+                        del draw
+
+                    changes += 1
+                    yield image_delta, bounding_box
 
         if changes > 0:
             self.prev_image = image.copy()
+            self.__prev_bytes = image_bytes
 
 
 class full_frame(object):
@@ -106,6 +280,8 @@ class full_frame(object):
     this is provided as a drop-in replacement.
     """
 
+    __slots__ = []
+
     def __init__(self, **kwargs):
         """
         Accepts any args but does nothing
@@ -104,8 +104,10 @@ class bitbang_6800(object):
         gpio.output(self._RS, mode)
         gpio.output(self._E, gpio.LOW)
         for value in data:
-            for i in range(self._datalines):
-                gpio.output(self._PINS[i], (value >> i) & 0x01)
+            # RPi.GPIO-compatible backends accept a list of channels with a
+            # list of values, setting the whole bus with one call instead
+            # of one call per data line
+            gpio.output(self._PINS, [(value >> i) & 0x01 for i in range(self._datalines)])
             gpio.output(self._E, gpio.HIGH)
             sleep(self._pulse_time)
             gpio.output(self._E, gpio.LOW)
@@ -551,8 +551,12 @@ class pcf8574(i2c):
     :type port: int
     :param address: I²C address, default: ``0x3C``.
     :type address: int
-    :param pulse_time: length of time in seconds that the enable line should be
-        held high during a data or command transfer (default: 50μs)
+    :param pulse_time: no longer controls the enable pulse width — the enable
+        line is pulsed within a single I²C block write, so its width is fixed
+        by the byte-frame time on the bus (~90μs at 100kHz) — but it still
+        provides the default command execution delay (``exec_time``) when this
+        interface is wrapped by a :py:class:`luma.core.device.parallel_device`
+        (default: 50μs)
     :type pulse_time: float
     :param backlight_enabled: Determines whether to activate the display's backlight
     :type backlight_enabled: bool
@@ -716,10 +720,14 @@ class pcf8574(i2c):
     def _write(self, data, mode):
         try:
             for value in data:
-                self._bus.write_byte(self._addr, self._backlight_enabled | mode | self._compute_pins(value))
-                self._bus.write_byte(self._addr, self._backlight_enabled | mode | self._compute_pins(value) | self._enable)
-                sleep(self._pulse_time)
-                self._bus.write_byte(self._addr, self._backlight_enabled | mode | self._compute_pins(value))
+                # A single block write clocks the assert / enable-pulse /
+                # deassert sequence onto the expander in one I²C transaction
+                # instead of three.  The enable line is held high for a full
+                # byte-frame on the wire (~90μs at 100kHz), comfortably above
+                # the pulse width the attached device requires, so no
+                # explicit sleep is needed between the edges.
+                base = self._backlight_enabled | mode | self._compute_pins(value)
+                self._bus.write_i2c_block_data(self._addr, base, [base | self._enable, base])
         except (IOError, OSError) as e:
             if e.errno in [errno.EREMOTEIO, errno.EIO]:
                 # I/O error
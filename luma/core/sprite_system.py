@@ -9,7 +9,7 @@ Simplified sprite animation framework.
           as such until such time as this notice disappears.
 """
 
-from time import sleep
+from time import sleep, perf_counter_ns
 from PIL import Image
 
 from luma.core.util import perf_counter
@@ -179,16 +179,32 @@ class framerate_regulator(object):
             fps = -1
 
         self.max_sleep_time = 1.0 / fps
-        self.total_transit_time = 0
         self.called = 0
         self.start_time = None
         self.last_time = None
 
+        # The per-frame bookkeeping is done on the integer nanosecond values
+        # from time.perf_counter_ns, which keeps the hot path free of float
+        # conversions; the public attributes above remain float seconds.
+        self.__max_sleep_ns = int(1e9 / fps) if fps > 0 else -1
+        self.__transit_ns = 0
+        self.__enter_ns = None
+        self.__last_ns = None
+
+    @property
+    def total_transit_time(self):
+        """
+        The accumulated time (in fractional seconds) spent between the enter
+        and exit methods.
+        """
+        return self.__transit_ns / 1e9
+
     def __enter__(self):
-        self.enter_time = perf_counter()
+        self.__enter_ns = perf_counter_ns()
         if not self.start_time:
-            self.start_time = self.enter_time
-            self.last_time = self.enter_time
+            self.start_time = self.__enter_ns / 1e9
+            self.last_time = self.start_time
+            self.__last_ns = self.__enter_ns
 
         return self
 
@@ -199,16 +215,18 @@ class framerate_regulator(object):
         frame rate (i.e. too much time has occurred since the last call), then
         it simply exits without blocking.
         """
+        now = perf_counter_ns()
         self.called += 1
-        self.total_transit_time += perf_counter() - self.enter_time
-        if self.max_sleep_time >= 0:
-            elapsed = perf_counter() - self.last_time
-            sleep_for = self.max_sleep_time - elapsed
+        self.__transit_ns += now - self.__enter_ns
+        if self.__max_sleep_ns >= 0:
+            sleep_for = self.__max_sleep_ns - (now - self.__last_ns)
 
             if sleep_for > 0:
-                sleep(sleep_for)
+                sleep(sleep_for / 1e9)
+                now = perf_counter_ns()
 
-        self.last_time = perf_counter()
+        self.__last_ns = now
+        self.last_time = now / 1e9
 
     def effective_FPS(self):
         """
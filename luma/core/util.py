@@ -14,7 +14,16 @@ class mutable_string(object):
 
     def __init__(self, value):
         assert isinstance(value, str) or isinstance(value, unicode)
-        self.target = value
+        self.__chars = list(value)
+        self.__cached = value
+
+    @property
+    def target(self):
+        # Mutations operate on the backing list in-place and invalidate
+        # this cache, so the string is only re-joined when next read
+        if self.__cached is None:
+            self.__cached = "".join(self.__chars)
+        return self.__cached
 
     def __getattr__(self, attr):
         return self.target.__getattribute__(attr)
@@ -24,17 +33,15 @@ class mutable_string(object):
 
     def __setitem__(self, key, value):
         assert isinstance(value, str) or isinstance(value, unicode)
-        tmp = list(self.target)
-        tmp[key] = value
-        self.target = ("" if isinstance(self.target, str) else u"").join(tmp)
+        self.__chars[key] = value
+        self.__cached = None
 
     def __delitem__(self, key):
-        tmp = list(self.target)
-        del tmp[key]
-        self.target = "".join(tmp)
+        del self.__chars[key]
+        self.__cached = None
 
     def __len__(self):
-        return len(self.target)
+        return len(self.__chars)
 
     def __iter__(self):
         return iter(self.target)
@@ -138,6 +145,10 @@ def unsigned_16_to_signed(value):
     return ((value) & 0x7FFF) - (0x8000 & (value))
 
 
+_HI_NIBBLES = bytes(x >> 4 for x in range(256))
+_LO_NIBBLES = bytes(0x0F & x for x in range(256))
+
+
 def bytes_to_nibbles(data):
     """
     Utility function to take a list of bytes (8 bit values) and turn it into
@@ -150,7 +161,14 @@ def bytes_to_nibbles(data):
 
     .. versionadded:: 1.16.0
     """
-    return [f(x) for x in data for f in (lambda x: x >> 4, lambda x: 0x0F & x)]
+    # Two 256-entry translation tables map the high and low nibbles in
+    # C-level passes, and the interleave is two extended-slice stores --
+    # no per-byte Python bytecode at all
+    buf = bytes(data)
+    out = bytearray(2 * len(buf))
+    out[0::2] = buf.translate(_HI_NIBBLES)
+    out[1::2] = buf.translate(_LO_NIBBLES)
+    return list(out)
 
 
 def perf_counter():
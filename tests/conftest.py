@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2024 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Shared pytest fixtures.
+"""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+import luma.core
+from luma.core import cmdline
+from luma.core.device import dummy
+
+from helpers import get_reference_file, SMBUS_SPEC, SPIDEV_SPEC, GPIO_SPEC
+
+
+def pytest_configure(config):
+    # Pre-compile the package under test so each xdist worker finds warm
+    # bytecode caches instead of compiling luma.core independently.
+    # Opt-in via the environment, as the first run pays the compile cost.
+    if os.environ.get('LUMA_PRECOMPILE'):
+        import compileall
+        compileall.compile_dir(
+            os.path.dirname(luma.core.__file__), quiet=1)
+
+
+@pytest.fixture
+def smbus():
+    """
+    A fresh spec'd smbus mock per test.
+    """
+    return Mock(spec_set=SMBUS_SPEC)
+
+
+@pytest.fixture
+def spidev():
+    """
+    A fresh spec'd spidev mock per test.
+    """
+    return Mock(spec_set=SPIDEV_SPEC)
+
+
+@pytest.fixture
+def gpio():
+    """
+    A fresh spec'd GPIO mock per test, with the pin constants the drivers
+    reference already assigned.
+    """
+    mock = Mock(spec_set=GPIO_SPEC)
+    mock.BCM = 1
+    mock.RST = 2
+    mock.DC = 3
+    mock.OUT = 4
+    mock.HIGH = 5
+    mock.LOW = 6
+    return mock
+
+
+@pytest.fixture
+def device():
+    """
+    A freshly-constructed :py:class:`luma.core.device.dummy` display.
+    """
+    return dummy()
+
+
+@pytest.fixture(scope="session")
+def config_file():
+    """
+    Path to the reference configuration file, resolved once per session.
+    """
+    return get_reference_file('config-test.txt')
+
+
+@pytest.fixture(scope="session")
+def config_file_args(config_file):
+    """
+    Parsed contents of the reference configuration file, loaded once per
+    session so each consuming test avoids a disk-backed parse.
+    """
+    return cmdline.load_config(config_file)
@@ -6,21 +6,34 @@
 Test helpers.
 """
 
+import hashlib
 import platform
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
-from PIL import ImageChops, ImageFont
+from PIL import Image, ImageChops, ImageFont
 from unittest.mock import mock_open
 
 
 rpi_gpio_missing = f'RPi.GPIO is not supported on this platform: {platform.system()}'
 spidev_missing = f'spidev is not supported on this platform: {platform.system()}'
 
+# Attribute specs for the mocked hardware interfaces: a spec'd mock only
+# materialises the handful of attributes the drivers actually touch (rather
+# than growing a child mock per attribute ever accessed), and misspelled
+# attribute access fails loudly instead of silently passing
+SMBUS_SPEC = ['open', 'close', 'write_i2c_block_data', 'write_byte', 'i2c_rdwr']
+SPIDEV_SPEC = ['open', 'close', 'writebytes', 'max_speed_hz', 'mode', 'no_cs']
+GPIO_SPEC = ['setmode', 'setwarnings', 'setup', 'output', 'cleanup',
+             'BCM', 'OUT', 'HIGH', 'LOW', 'RST', 'DC']
 
+
+@lru_cache(maxsize=None)
 def get_reference_file(fname):
     """
-    Get absolute path for ``fname``.
+    Get absolute path for ``fname``. Paths are memoized, so repeated lookups
+    of the same file resolve without touching the filesystem again.
 
     :param fname: Filename.
     :type fname: str or pathlib.Path
@@ -37,6 +50,36 @@ def get_reference_image(fname):
     return get_reference_file(Path('images').joinpath(fname))
 
 
+@lru_cache(maxsize=None)
+def load_reference_image(fname):
+    """
+    Load (and cache) the decoded reference image for ``fname``, so the PNG
+    is only read and decoded once per session rather than per test.
+
+    :param fname: Filename.
+    :type fname: str or pathlib.Path
+    :rtype: PIL.Image.Image
+    """
+    with open(get_reference_image(fname), 'rb') as fp:
+        img = Image.open(fp)
+        img.load()
+        return img
+
+
+@lru_cache(maxsize=None)
+def get_reference_file_bytes(fname):
+    """
+    Read (and cache) the raw contents of the reference file ``fname``, so
+    repeated parametrized runs share one disk read.
+
+    :param fname: Filename.
+    :type fname: str or pathlib.Path
+    :rtype: bytes
+    """
+    with open(get_reference_file(fname), 'rb') as fp:
+        return fp.read()
+
+
 def get_reference_font(fname, fsize=12):
     """
     :param fname: Filename of the font.
@@ -70,14 +113,31 @@ def get_spidev():
         pytest.skip(spidev_missing)
 
 
+def digest(image):
+    """
+    A compact 128-bit digest of an image's pixel contents, suitable for
+    comparing frames for equality without holding onto their full buffers.
+
+    :param image: The image to fingerprint.
+    :type image: PIL.Image.Image
+    :rtype: bytes
+    """
+    return hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+
+
 def assert_identical_image(reference, target, img_path):
     """
     :param img_path: Location of image.
     :type img_path: str
     """
+    # Digest comparison is a single pass over each pixel buffer; only fall
+    # back to the (slower) per-channel difference when it fails, to report
+    # where the images diverge.
+    if reference.mode == target.mode and digest(reference) == digest(target):
+        return
     bbox = ImageChops.difference(reference, target).getbbox()
     # target.save(img_path)
-    assert bbox is None, f'{img_path} is not identical to generated image'
+    assert bbox is None, f'{img_path} is not identical to generated image (differs within {bbox})'
 
 
 def i2c_error(path_name, err_no):
@@ -97,6 +157,12 @@ def fib(n):
         a, b = b, a + b
 
 
+# Pre-computed payloads for the serial interface tests, so each test gets
+# the same list without regenerating the sequence
+FIB10 = list(fib(10))
+FIB100 = list(fib(100))
+
+
 # Attribution: https://gist.github.com/adammartinez271828/137ae25d0b817da2509c1a96ba37fc56
 def multi_mock_open(*file_contents):
     """Create a mock "open" that will mock open multiple files in sequence
@@ -7,21 +7,20 @@
 Tests for the :py:mod:`luma.core.cmdline` module.
 """
 
+import sys
 import pytest
 import errno
+from types import SimpleNamespace
 from unittest.mock import patch, Mock
 
 from luma.core import cmdline, error
 from luma.core.interface.serial import __all__ as serial_iface_types
 from luma.core.interface.parallel import __all__ as parallel_iface_types
 
-from helpers import (get_reference_file, i2c_error, rpi_gpio_missing,
+from helpers import (i2c_error, rpi_gpio_missing,
     spidev_missing, skip_unsupported_platform)
 
 
-test_config_file = get_reference_file('config-test.txt')
-
-
 class test_spi_opts(object):
     spi_port = 0
     spi_mode = 0
@@ -41,6 +40,26 @@ class test_spi_opts(object):
     framebuffer_device = None
 
 
+@pytest.fixture
+def luma_module_mocks(monkeypatch):
+    """
+    Installs a single shared mock into every ``sys.modules`` entry that
+    :py:func:`luma.core.cmdline.create_device` may import. ``monkeypatch``
+    patches each key in O(1), unlike ``patch.dict('sys.modules', ...)``
+    which snapshots the entire (large) module dict on enter and exit.
+    """
+    module_mock = Mock(unsafe=True)
+    for name in [
+            'luma', 'luma.oled', 'luma.oled.device',
+            'luma.lcd', 'luma.lcd.aux', 'luma.lcd.device',
+            'luma.led_matrix', 'luma.led_matrix.device',
+            'luma.emulator', 'luma.emulator.device',
+            'luma.core', 'luma.core.device',
+            'spidev', 'fake_gpio']:
+        monkeypatch.setitem(sys.modules, name, module_mock)
+    return module_mock
+
+
 def test_get_interface_types():
     """
     Enumerate interface types.
@@ -85,9 +104,9 @@ def test_get_library_version():
     lib_name = 'hotscreenz'
     lib_version = '0.1.2'
 
-    # set version nr for fake luma library
-    luma_fake_lib = Mock()
-    luma_fake_lib.__version__ = lib_version
+    # fake luma library with a version number; a plain namespace is enough
+    # here (and cheaper than a Mock) as only attribute access is exercised
+    luma_fake_lib = SimpleNamespace(__version__=lib_version)
 
     # version is found
     with patch.dict('sys.modules', {'luma.' + lib_name: luma_fake_lib}):
@@ -95,7 +114,7 @@ def test_get_library_version():
 
     # no version for module without __version__ attribute
     lib_name = 'no_version'
-    luma_without_version_lib = Mock()
+    luma_without_version_lib = SimpleNamespace()
     with patch.dict('sys.modules', {'luma.' + lib_name: luma_without_version_lib}):
         assert cmdline.get_library_version(lib_name) is None
 
@@ -119,24 +138,28 @@ def test_get_library_for_display_type():
         assert cmdline.get_library_for_display_type(display_type) == lib_name
 
 
-def test_load_config_file_parse():
+EXPECTED_CONFIG = [
+    '--display=capture',
+    '--width=800',
+    '--height=8600',
+    '--spi-bus-speed=16000000'
+]
+
+
+def test_load_config_file_parse(config_file_args):
     """
     :py:func:`luma.core.cmdline.load_config` parses a text file and returns a
     list of arguments.
     """
-    result = cmdline.load_config(test_config_file)
-    assert result == [
-        '--display=capture',
-        '--width=800',
-        '--height=8600',
-        '--spi-bus-speed=16000000'
-    ]
+    assert config_file_args == EXPECTED_CONFIG
 
 
-def test_create_parser():
+@pytest.fixture(scope="module")
+def parser():
     """
-    :py:func:`luma.core.cmdline.create_parser` returns an argument parser
-    instance.
+    Argument parser built by :py:func:`luma.core.cmdline.create_parser`,
+    constructed once per module: the parser is stateless after creation, and
+    building the full argument tree is the expensive part.
     """
     with patch.dict('sys.modules', **{
             'luma.emulator': Mock(),
@@ -149,8 +172,20 @@ def test_create_parser():
                 'emulator': ['e', 'f']
             }
             parser = cmdline.create_parser(description='test')
-            args = parser.parse_args(['-f', test_config_file])
-            assert args.config == test_config_file
+
+    # The patches are only needed while the parser is built; exit them
+    # before yielding so later tests in the module see the real
+    # get_display_types and sys.modules
+    yield parser
+
+
+def test_create_parser(parser, config_file):
+    """
+    :py:func:`luma.core.cmdline.create_parser` returns an argument parser
+    instance.
+    """
+    args = parser.parse_args(['-f', config_file])
+    assert args.config == config_file
 
 
 def test_make_interface_noop():
@@ -164,9 +199,11 @@ def test_make_interface_noop():
     assert 'luma.core.interface.serial.noop' in repr(factory.noop())
 
 
-def test_make_interface_i2c():
+@pytest.mark.parametrize("factory_name", ["i2c", "pcf8574"])
+def test_make_interface_i2c_based(factory_name):
     """
-    :py:func:`luma.core.cmdline.make_interface.i2c` returns an I2C instance.
+    :py:func:`luma.core.cmdline.make_interface` I²C-based factory methods
+    raise an error when the underlying device cannot be found.
     """
     class opts:
         i2c_port = 200
@@ -178,16 +215,22 @@ def test_make_interface_i2c():
 
     with patch('os.open', fake_open):
         with pytest.raises(error.DeviceNotFoundError):
-            factory.i2c()
+            getattr(factory, factory_name)()
 
 
-def test_make_interface_spi():
+@pytest.mark.parametrize("factory_name,expected", [
+    ("spi", 'luma.core.interface.serial.spi'),
+    ("bitbang", 'luma.core.interface.serial.bitbang'),
+    ("bitbang_6800", 'luma.core.interface.parallel.bitbang_6800'),
+])
+def test_make_interface_gpio_based(factory_name, expected):
     """
-    :py:func:`luma.core.cmdline.make_interface.spi` returns an SPI instance.
+    :py:func:`luma.core.cmdline.make_interface` GPIO-based factory methods
+    return an instance of the expected interface class.
     """
     try:
         factory = cmdline.make_interface(test_spi_opts)
-        assert 'luma.core.interface.serial.spi' in repr(factory.spi())
+        assert expected in repr(getattr(factory, factory_name)())
     except ImportError:
         # non-rpi platform, e.g. macos
         pytest.skip(rpi_gpio_missing)
@@ -216,10 +259,15 @@ def test_make_interface_gpio_cs_spi():
         skip_unsupported_platform(e)
 
 
-def test_make_interface_spi_alt_gpio():
+@pytest.mark.parametrize("factory_name,expected", [
+    ("spi", 'luma.core.interface.serial.spi'),
+    ("bitbang_6800", 'luma.core.interface.parallel.bitbang_6800'),
+])
+def test_make_interface_alt_gpio(factory_name, expected):
     """
-    :py:func:`luma.core.cmdline.make_interface.spi` returns an SPI instance
-    when using an alternative GPIO implementation.
+    :py:func:`luma.core.cmdline.make_interface` factory methods return an
+    instance of the expected interface class when using an alternative GPIO
+    implementation.
     """
     class opts(test_spi_opts):
         gpio = 'fake_gpio'
@@ -229,78 +277,7 @@ def test_make_interface_spi_alt_gpio():
         }):
         try:
             factory = cmdline.make_interface(opts)
-            assert 'luma.core.interface.serial.spi' in repr(factory.spi())
-        except ImportError:
-            pytest.skip(spidev_missing)
-        except error.DeviceNotFoundError as e:
-            # non-rpi platform, e.g. ubuntu 64-bit
-            skip_unsupported_platform(e)
-
-
-def test_make_interface_bitbang():
-    """
-    :py:func:`luma.core.cmdline.make_interface.bitbang` returns an BitBang instance.
-    """
-    try:
-        factory = cmdline.make_interface(test_spi_opts)
-        assert 'luma.core.interface.serial.bitbang' in repr(factory.bitbang())
-    except ImportError:
-        # non-rpi platform, e.g. macos
-        pytest.skip(rpi_gpio_missing)
-    except error.UnsupportedPlatform as e:
-        # non-rpi platform, e.g. ubuntu 64-bit
-        skip_unsupported_platform(e)
-
-
-def test_make_interface_pcf8574():
-    """
-    :py:func:`luma.core.cmdline.make_interface.pcf8574` returns an pcf8574 instance.
-    """
-    class opts:
-        i2c_port = 200
-        i2c_address = 0x710
-
-    path_name = f'/dev/i2c-{opts.i2c_port}'
-    fake_open = i2c_error(path_name, errno.ENOENT)
-    factory = cmdline.make_interface(opts)
-
-    with patch('os.open', fake_open):
-        with pytest.raises(error.DeviceNotFoundError):
-            factory.pcf8574()
-
-
-def test_make_interface_bitbang_6800():
-    """
-    :py:func:`luma.core.cmdline.make_interface.bitbang_6800` returns a Bitbang-6800 instance.
-    """
-    class opts:
-        pass
-
-    try:
-        factory = cmdline.make_interface(opts)
-        assert 'luma.core.interface.parallel.bitbang_6800' in repr(factory.bitbang_6800())
-    except ImportError:
-        # non-rpi platform, e.g. macos
-        pytest.skip(rpi_gpio_missing)
-    except error.UnsupportedPlatform as e:
-        # non-rpi platform, e.g. ubuntu 64-bit
-        skip_unsupported_platform(e)
-
-
-def test_make_interface_bitbang_6800_alt_gpio():
-    """
-    :py:func:`luma.core.cmdline.make_interface.bitbang_6800` returns an Bitbang-6800 instance
-    when using an alternative GPIO implementation.
-    """
-    class opts():
-        gpio = 'fake_gpio'
-
-    with patch.dict('sys.modules', **{
-            'fake_gpio': Mock(unsafe=True)
-        }):
-        try:
-            factory = cmdline.make_interface(opts)
-            assert 'luma.core.interface.parallel.bitbang_6800' in repr(factory.bitbang_6800())
+            assert expected in repr(getattr(factory, factory_name)())
         except ImportError:
             pytest.skip(spidev_missing)
         except error.DeviceNotFoundError as e:
@@ -318,127 +295,32 @@ def test_create_device():
     assert cmdline.create_device(args) is None
 
 
-def test_create_device_oled():
+@pytest.mark.parametrize("lib,display_name,extra_args", [
+    ("oled", 'oled1234', {}),
+    ("lcd", 'lcd1234', {'gpio': 'fake_gpio', 'backlight_active': 'low'}),
+    ("led_matrix", 'matrix1234', {}),
+    ("emulator", 'emulator1234', {}),
+    ("core", 'coredevice1234', {}),
+])
+def test_create_device_kind(lib, display_name, extra_args, luma_module_mocks):
     """
-    :py:func:`luma.core.cmdline.create_device` supports OLED displays.
+    :py:func:`luma.core.cmdline.create_device` supports displays from each
+    luma sub-project.
     """
-    display_name = 'oled1234'
-    display_types = {'oled': [display_name]}
+    display_types = {lib: [display_name]}
 
-    class args(test_spi_opts):
-        display = display_name
+    args = type('args', (test_spi_opts,), dict(display=display_name, **extra_args))
 
-    module_mock = Mock()
-    module_mock.oled.device.oled1234.return_value = display_name
-    with patch.dict('sys.modules', **{
-            # mock luma.oled package
-            'luma': module_mock,
-            'luma.oled': module_mock,
-            'luma.oled.device': module_mock
-        }):
-        try:
-            device = cmdline.create_device(args, display_types=display_types)
-            assert device == display_name
-        except ImportError:
-            pytest.skip(rpi_gpio_missing)
-        except error.UnsupportedPlatform as e:
-            # non-rpi platform
-            skip_unsupported_platform(e)
-
-
-def test_create_device_lcd():
-    """
-    :py:func:`luma.core.cmdline.create_device` supports LCD displays.
-    """
-    display_name = 'lcd1234'
-    display_types = {'lcd': [display_name]}
-
-    class args(test_spi_opts):
-        display = display_name
-        gpio = 'fake_gpio'
-        backlight_active = 'low'
-
-    module_mock = Mock()
-    module_mock.lcd.device.lcd1234.return_value = display_name
-    with patch.dict('sys.modules', **{
-            # mock spidev and luma.lcd packages
-            'fake_gpio': module_mock,
-            'spidev': module_mock,
-            'luma': module_mock,
-            'luma.lcd': module_mock,
-            'luma.lcd.aux': module_mock,
-            'luma.lcd.device': module_mock
-        }):
-        device = cmdline.create_device(args, display_types=display_types)
-        assert device == display_name
-
-
-def test_create_device_led_matrix():
-    """
-    :py:func:`luma.core.cmdline.create_device` supports LED matrix displays.
-    """
-    display_name = 'matrix1234'
-    display_types = {'led_matrix': [display_name]}
-
-    class args(test_spi_opts):
-        display = display_name
-
-    module_mock = Mock()
-    module_mock.led_matrix.device.matrix1234.return_value = display_name
-    with patch.dict('sys.modules', **{
-            # mock spidev and luma.led_matrix packages
-            'spidev': module_mock,
-            'luma': module_mock,
-            'luma.led_matrix': module_mock,
-            'luma.led_matrix.device': module_mock
-        }):
-        device = cmdline.create_device(args, display_types=display_types)
-        assert device == display_name
-
-
-def test_create_device_emulator():
-    """
-    :py:func:`luma.core.cmdline.create_device` supports emulators.
-    """
-    display_name = 'emulator1234'
-    display_types = {'emulator': [display_name]}
-
-    class args(test_spi_opts):
-        display = display_name
-
-    module_mock = Mock()
-    module_mock.emulator.device.emulator1234.return_value = display_name
-    with patch.dict('sys.modules', **{
-            # mock spidev and luma.emulator packages
-            'spidev': module_mock,
-            'luma': module_mock,
-            'luma.emulator': module_mock,
-            'luma.emulator.device': module_mock
-        }):
-        device = cmdline.create_device(args, display_types=display_types)
-        assert device == display_name
-
-
-def test_create_device_core():
-    """
-    :py:func:`luma.core.cmdline.create_device` supports code devices.
-    """
-    display_name = 'coredevice1234'
-    display_types = {'core': [display_name]}
-
-    class args(test_spi_opts):
-        display = display_name
-
-    module_mock = Mock()
-    module_mock.core.device.coredevice1234.return_value = display_name
-    with patch.dict('sys.modules', **{
-            # mock luma.core package
-            'luma': module_mock,
-            'luma.core': module_mock,
-            'luma.core.device': module_mock
-        }):
+    device_factory = getattr(luma_module_mocks, lib).device
+    getattr(device_factory, display_name).return_value = display_name
+    try:
         device = cmdline.create_device(args, display_types=display_types)
         assert device == display_name
+    except ImportError:
+        pytest.skip(rpi_gpio_missing)
+    except error.UnsupportedPlatform as e:
+        # non-rpi platform
+        skip_unsupported_platform(e)
 
 
 @patch('pyftdi.spi.SpiController')
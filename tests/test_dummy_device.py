@@ -7,13 +7,13 @@
 Tests for the :py:class:`luma.core.device.dummy` class.
 """
 
-from PIL import Image
+import pytest
 
 from luma.core.render import canvas
 from luma.core.device import dummy
 
 import baseline_data
-from helpers import get_reference_image, assert_identical_image
+from helpers import get_reference_image, load_reference_image, assert_identical_image
 
 
 def test_capture_noops():
@@ -27,32 +27,31 @@ def test_capture_noops():
     device.data([1, 2, 4, 4])
 
 
+@pytest.mark.slow
 def test_portrait():
     img_path = get_reference_image('portrait.png')
+    reference = load_reference_image('portrait.png')
 
-    with open(img_path, 'rb') as p:
-        reference = Image.open(p)
+    device = dummy(rotate=1)
 
-        device = dummy(rotate=1)
+    # Use the same drawing primitives as the demo
+    with canvas(device) as draw:
+        baseline_data.primitives(device, draw)
 
-        # Use the same drawing primitives as the demo
-        with canvas(device) as draw:
-            baseline_data.primitives(device, draw)
-
-        assert_identical_image(reference, device.image, img_path)
+    assert_identical_image(reference, device.image, img_path)
 
 
+@pytest.mark.slow
 def test_dither():
     img_path = get_reference_image('dither.png')
+    reference = load_reference_image('dither.png')
 
-    with open(img_path, 'rb') as p:
-        reference = Image.open(p)
-        device = dummy(mode="1")
+    device = dummy(mode="1")
 
-        with canvas(device, dither=True) as draw:
-            draw.rectangle((0, 0, 64, 32), fill="red")
-            draw.rectangle((64, 0, 128, 32), fill="yellow")
-            draw.rectangle((0, 32, 64, 64), fill="blue")
-            draw.rectangle((64, 32, 128, 64), fill="white")
+    with canvas(device, dither=True) as draw:
+        draw.rectangle((0, 0, 64, 32), fill="red")
+        draw.rectangle((64, 0, 128, 32), fill="yellow")
+        draw.rectangle((0, 32, 64, 64), fill="blue")
+        draw.rectangle((64, 32, 128, 64), fill="white")
 
-        assert_identical_image(reference, device.image, img_path)
+    assert_identical_image(reference, device.image, img_path)
@@ -3,7 +3,7 @@
 # Copyright (c) 2017-18 Richard Hull and contributors
 # See LICENSE.rst for details.
 
-from PIL import Image, ImageDraw
+from PIL import Image, ImageChops, ImageDraw
 from luma.core.framebuffer import full_frame, diff_to_previous
 
 
@@ -60,6 +60,104 @@ def test_diff_to_previous():
     assert redraws[1][1] == (0, 20, 20, 40)
 
 
+def test_diff_to_previous_full_refresh_ratio():
+    framebuffer = diff_to_previous(num_segments=4, full_refresh_ratio=0.75)
+    list(framebuffer.redraw(im1))
+
+    # im2 only touches two of the four segments (half the image area),
+    # so per-segment differences are still emitted
+    redraws = list(framebuffer.redraw(im2))
+    assert len(redraws) == 2
+
+    # An image that changes all four segments crosses the ratio, and the
+    # changesets collapse into a single full-frame redraw
+    im3 = Image.new("RGB", (40, 40))
+    draw = ImageDraw.Draw(im3)
+    draw.rectangle((0, 0, 39, 39), outline="white")
+
+    redraws = list(framebuffer.redraw(im3))
+    assert len(redraws) == 1
+    assert redraws[0][0] == im3
+    assert redraws[0][1] == (0, 0, 40, 40)
+
+
+def test_diff_to_previous_quiet_threshold():
+    framebuffer = diff_to_previous(num_segments=4, quiet_threshold=1)
+    list(framebuffer.redraw(im1))
+
+    # A single slightly-off pixel is below the mean-difference threshold,
+    # so the redraw is suppressed
+    nearly_im1 = im1.copy()
+    nearly_im1.putpixel((0, 0), (8, 8, 8))
+    redraws = list(framebuffer.redraw(nearly_im1))
+    assert len(redraws) == 0
+
+    # A substantial change still renders (relative to the last frame that
+    # was actually displayed)
+    redraws = list(framebuffer.redraw(im2))
+    assert len(redraws) == 2
+
+
+def test_diff_to_previous_scroll_detect():
+    # An image where every row is distinct, so a shifted copy can only
+    # match at one offset
+    base = Image.new("RGB", (40, 40))
+    draw = ImageDraw.Draw(base)
+    for y in range(40):
+        draw.line((0, y) + (39, y), fill=(y, 2 * y, 3 * y))
+
+    framebuffer = diff_to_previous(num_segments=4, scroll_detect=True)
+    list(framebuffer.redraw(base))
+    assert framebuffer.scroll_offset is None
+
+    # Scrolling up by 10 rows collapses to a single full-frame redraw,
+    # with the shift recorded for consumers that can exploit it
+    scrolled = ImageChops.offset(base, 0, -10)
+    redraws = list(framebuffer.redraw(scrolled))
+    assert len(redraws) == 1
+    assert redraws[0][0] == scrolled
+    assert redraws[0][1] == (0, 0, 40, 40)
+    assert framebuffer.scroll_offset == -10
+
+    # ... and back down again
+    redraws = list(framebuffer.redraw(base))
+    assert len(redraws) == 1
+    assert framebuffer.scroll_offset == 10
+
+    # An unchanged frame clears the stale offset
+    assert list(framebuffer.redraw(base)) == []
+    assert framebuffer.scroll_offset is None
+
+    # A non-scroll change is still diffed per segment
+    list(framebuffer.redraw(im1))
+    assert framebuffer.scroll_offset is None
+
+
+def test_diff_to_previous_merge_segments():
+    framebuffer = diff_to_previous(num_segments=4, merge_segments=True)
+    blank = Image.new("RGB", (40, 40))
+    list(framebuffer.redraw(blank))
+
+    # A horizontal line through both top segments coalesces into a single
+    # redraw spanning their combined bounding box
+    lined = Image.new("RGB", (40, 40))
+    draw = ImageDraw.Draw(lined)
+    draw.line((0, 10) + (39, 10), fill="white")
+
+    redraws = list(framebuffer.redraw(lined))
+    assert len(redraws) == 1
+    assert redraws[0][0] == lined.crop((0, 10, 40, 11))
+    assert redraws[0][1] == (0, 10, 40, 11)
+
+    # Diagonally-changed segments are not adjacent, so they stay separate
+    framebuffer = diff_to_previous(num_segments=4, merge_segments=True)
+    list(framebuffer.redraw(im1))
+    redraws = list(framebuffer.redraw(im2))
+    assert len(redraws) == 2
+    assert redraws[0][1] == (20, 0, 40, 20)
+    assert redraws[1][1] == (0, 20, 20, 40)
+
+
 def test_diff_to_previous_debug():
     framebuffer = diff_to_previous(num_segments=4, debug=True)
     redraws = list(framebuffer.redraw(im1))
@@ -10,7 +10,7 @@ Tests for the :py:class:`luma.core.interface.serial.ftdi_i2c` class.
 import pytest
 from unittest.mock import Mock, patch
 from luma.core.interface.serial import ftdi_i2c
-from helpers import fib
+from helpers import FIB100
 import luma.core.error
 
 
@@ -41,7 +41,7 @@ def test_command(mock_controller):
 
 @patch('pyftdi.i2c.I2cController')
 def test_data(mock_controller):
-    data = list(fib(100))
+    data = FIB100
     port = Mock()
     instance = Mock()
     instance.get_port = Mock(return_value=port)
@@ -7,19 +7,41 @@
 Tests for the :py:class:`luma.core.interface.serial.ftdi_spi` class.
 """
 
+import pytest
 from unittest.mock import Mock, call, patch
 from luma.core.interface.serial import ftdi_spi
-from helpers import fib, assert_only_cleans_whats_setup
+from helpers import FIB100, assert_only_cleans_whats_setup
 
 
-@patch('pyftdi.spi.SpiController')
-def test_init(mock_controller):
+@pytest.fixture(scope="module")
+def mock_controller():
+    """
+    Patch pyftdi's SpiController once for the whole module, rather than
+    tearing the patch down and re-applying it around every test.
+    """
+    with patch('pyftdi.spi.SpiController') as controller:
+        yield controller
+
+
+@pytest.fixture
+def ftdi_mocks(mock_controller):
+    """
+    Wires a fresh fake controller instance (with its port and gpio) into
+    the shared patch for each test, returning ``(instance, port, gpio)``.
+    """
+    mock_controller.reset_mock()
     gpio = Mock()
     gpio.width = 8
+    port = Mock()
     instance = Mock()
-    instance.get_port = Mock()
+    instance.get_port = Mock(return_value=port)
     instance.get_gpio = Mock(return_value=gpio)
     mock_controller.side_effect = [instance]
+    return instance, port, gpio
+
+
+def test_init(mock_controller, ftdi_mocks):
+    instance, port, gpio = ftdi_mocks
 
     ftdi_spi(device='ftdi://dummy', bus_speed_hz=16000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
     mock_controller.assert_called_with(cs_count=1)
@@ -29,16 +51,9 @@ def test_init(mock_controller):
     gpio.set_direction.assert_called_with(0x60, 0x60)
 
 
-@patch('pyftdi.spi.SpiController')
-def test_command(mock_controller):
+def test_command(ftdi_mocks):
     cmds = [3, 1, 4, 2]
-    gpio = Mock()
-    gpio.width = 8
-    port = Mock()
-    instance = Mock()
-    instance.get_port = Mock(return_value=port)
-    instance.get_gpio = Mock(return_value=gpio)
-    mock_controller.side_effect = [instance]
+    instance, port, gpio = ftdi_mocks
 
     serial = ftdi_spi(device='ftdi://dummy', bus_speed_hz=16000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
     serial.command(*cmds)
@@ -46,16 +61,9 @@ def test_command(mock_controller):
     port.write.assert_called_once_with(cmds)
 
 
-@patch('pyftdi.spi.SpiController')
-def test_data(mock_controller):
-    data = list(fib(100))
-    gpio = Mock()
-    gpio.width = 8
-    port = Mock()
-    instance = Mock()
-    instance.get_port = Mock(return_value=port)
-    instance.get_gpio = Mock(return_value=gpio)
-    mock_controller.side_effect = [instance]
+def test_data(ftdi_mocks):
+    data = FIB100
+    instance, port, gpio = ftdi_mocks
 
     serial = ftdi_spi(device='ftdi://dummy', bus_speed_hz=16000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
     serial.data(data)
@@ -63,15 +71,8 @@ def test_data(mock_controller):
     port.write.assert_called_once_with(data)
 
 
-@patch('pyftdi.spi.SpiController')
-def test_cleanup(mock_controller):
-    gpio = Mock()
-    gpio.width = 8
-    port = Mock()
-    instance = Mock()
-    instance.get_port = Mock(return_value=port)
-    instance.get_gpio = Mock(return_value=gpio)
-    mock_controller.side_effect = [instance]
+def test_cleanup(ftdi_mocks):
+    instance, port, gpio = ftdi_mocks
 
     serial = ftdi_spi(device='ftdi://dummy', bus_speed_hz=16000000, gpio_CS=3, gpio_DC=5, gpio_RST=6)
     serial.cleanup()
@@ -7,38 +7,25 @@
 Tests for the :py:class:`luma.core.interface.serial.gpio_cs_spi` class.
 """
 
+import errno
 import pytest
 from unittest.mock import Mock, call
 
 from luma.core.interface.serial import gpio_cs_spi
 import luma.core.error
 
-from helpers import get_spidev, rpi_gpio_missing, fib, assert_only_cleans_whats_setup
+from helpers import (rpi_gpio_missing, FIB100, SPIDEV_SPEC,
+    assert_only_cleans_whats_setup)
 
 
-spidev = Mock(unsafe=True)
-gpio = Mock(unsafe=True)
-
-
-def setup_function(function):
-    spidev.reset_mock()
-    gpio.reset_mock()
-    gpio.BCM = 1
-    gpio.RST = 2
-    gpio.DC = 3
-    gpio.OUT = 4
-    gpio.HIGH = 5
-    gpio.LOW = 6
-
-
-def verify_gpio_cs_spi_init(port, device, bus_speed_hz=8000000, dc=24, rst=25, cs=23):
+def verify_gpio_cs_spi_init(spidev, gpio, port, device, bus_speed_hz=8000000, dc=24, rst=25, cs=23):
     spidev.open.assert_called_once_with(port, device)
     assert spidev.max_speed_hz == bus_speed_hz
     gpio.setmode.assert_not_called()
     gpio.setup.assert_has_calls([call(dc, gpio.OUT), call(rst, gpio.OUT), call(cs, gpio.OUT, initial=gpio.HIGH)])
 
 
-def test_init():
+def test_init(spidev, gpio):
     port = 5
     device = 2
     bus_speed = 16000000
@@ -48,54 +35,61 @@ def test_init():
 
     gpio_cs_spi(gpio=gpio, spi=spidev, port=port, device=device, bus_speed_hz=16000000,
         gpio_DC=dc, gpio_RST=rst, gpio_CS=cs)
-    verify_gpio_cs_spi_init(port, device, bus_speed, dc, rst, cs)
+    verify_gpio_cs_spi_init(spidev, gpio, port, device, bus_speed, dc, rst, cs)
     gpio.output.assert_has_calls([
         call(rst, gpio.LOW),
         call(rst, gpio.HIGH)
     ])
 
 
-def test_init_invalid_bus_speed():
+def test_init_invalid_bus_speed(spidev, gpio):
     with pytest.raises(AssertionError):
         gpio_cs_spi(gpio=gpio, spi=spidev, port=5, device=2, bus_speed_hz=942312, gpio_CS=23)
 
 
-def test_command():
+def test_command(spidev, gpio):
     cmds = [3, 1, 4, 2]
     serial = gpio_cs_spi(gpio=gpio, spi=spidev, port=9, device=1, gpio_CS=23)
     serial.command(*cmds)
-    verify_gpio_cs_spi_init(9, 1)
-    gpio.output.assert_has_calls([call(25, gpio.HIGH), call(24, gpio.LOW), call(23, gpio.LOW), call(23, gpio.HIGH)])
+    verify_gpio_cs_spi_init(spidev, gpio, 9, 1)
+    # Comparing the tail of the call list directly checks the exact order
+    # of the last four pin writes, without assert_has_calls scanning the
+    # whole history for a matching subsequence
+    assert gpio.output.call_args_list[-4:] == \
+        [call(25, gpio.HIGH), call(24, gpio.LOW), call(23, gpio.LOW), call(23, gpio.HIGH)]
     spidev.writebytes.assert_called_once_with(cmds)
 
 
-def test_data():
-    data = list(fib(100))
+def test_data(spidev, gpio):
+    data = FIB100
     serial = gpio_cs_spi(gpio=gpio, spi=spidev, port=9, device=1, gpio_CS=23)
     serial.data(data)
-    verify_gpio_cs_spi_init(9, 1)
-    gpio.output.assert_has_calls([call(25, gpio.HIGH), call(24, gpio.HIGH), call(23, gpio.LOW), call(23, gpio.HIGH)])
+    verify_gpio_cs_spi_init(spidev, gpio, 9, 1)
+    assert gpio.output.call_args_list[-4:] == \
+        [call(25, gpio.HIGH), call(24, gpio.HIGH), call(23, gpio.LOW), call(23, gpio.HIGH)]
     spidev.writebytes.assert_called_once_with(data)
 
 
-def test_cleanup():
+def test_cleanup(spidev, gpio):
     serial = gpio_cs_spi(gpio=gpio, spi=spidev, port=9, device=1, gpio_CS=23)
     serial._managed = True
     serial.cleanup()
-    verify_gpio_cs_spi_init(9, 1)
+    verify_gpio_cs_spi_init(spidev, gpio, 9, 1)
     spidev.close.assert_called_once_with()
     assert_only_cleans_whats_setup(gpio)
 
 
-def test_init_device_not_found():
-    spidev = get_spidev()
-    port = 1234
+def test_init_device_not_found(gpio):
+    # A mock device whose open() fails like a missing /dev/spidev node:
+    # no real spidev import or filesystem probe needed
+    missing = Mock(spec_set=SPIDEV_SPEC)
+    missing.open.side_effect = FileNotFoundError(errno.ENOENT, 'No such file or directory')
     with pytest.raises(luma.core.error.DeviceNotFoundError) as ex:
-        gpio_cs_spi(gpio=gpio, spi=spidev.SpiDev(), port=port, gpio_CS=23)
+        gpio_cs_spi(gpio=gpio, spi=missing, port=1234, gpio_CS=23)
     assert str(ex.value) == 'SPI device not found'
 
 
-def test_unsupported_gpio_platform():
+def test_unsupported_gpio_platform(spidev):
     try:
         gpio_cs_spi(spi=spidev, port=9, device=1, gpio_CS=23)
     except luma.core.error.UnsupportedPlatform as ex:
@@ -6,23 +6,22 @@
 
 import pytest
 
+from PIL import Image, ImageDraw
+
 from luma.core.render import canvas
-from luma.core.device import dummy
 from luma.core.virtual import history
 
 import baseline_data
 
 
-def test_restore_throws_error_when_empty():
-    device = dummy()
+def test_restore_throws_error_when_empty(device):
     hist = history(device)
     assert len(hist) == 0
     with pytest.raises(IndexError):
         hist.restore()
 
 
-def test_save_and_restore_reverts_image():
-    device = dummy()
+def test_save_and_restore_reverts_image(device):
     hist = history(device)
 
     with canvas(hist) as draw:
@@ -43,14 +42,20 @@ def test_save_and_restore_reverts_image():
     assert len(hist) == 0
 
 
-def test_drop_and_restore():
-    device = dummy()
+def test_drop_and_restore(device):
     hist = history(device)
 
+    # history.display() takes a copy, so a single image and draw context
+    # can be reused for all ten savepoints rather than a canvas allocating
+    # a fresh frame per iteration
+    img = Image.new(device.mode, device.size)
+    draw = ImageDraw.Draw(img)
+
     copies = []
     for i in range(10):
-        with canvas(hist) as draw:
-            draw.text((10, 10), text=f"Hello {i}", fill="white")
+        draw.rectangle((0, 0) + device.size, fill="black")
+        draw.text((10, 10), text=f"Hello {i}", fill="white")
+        hist.display(img)
         hist.savepoint()
         copies.append(device.image)
 
@@ -12,7 +12,6 @@ import pytest
 import PIL
 
 from PIL import Image, ImageDraw
-from luma.core.device import dummy
 from luma.core.image_composition import ComposableImage, ImageComposition
 
 
@@ -48,64 +47,55 @@ def test_composable_image_ctor():
     assert isinstance(ci.image((1, 1)), PIL.Image.Image)
 
 
-def test_composable_image_crop_same():
-    img_size = (128, 64)
-    crop_size = img_size
-    img = Image.new("RGB", img_size)
-    ci = ComposableImage(img)
-    cropped_img = ci.image(crop_size)
-    assert cropped_img.size == crop_size
-
-
-def test_composable_image_crop_size_smaller_than_image_size():
-    img_size = (128, 64)
-    crop_size = (10, 10)
-    img = Image.new("RGB", img_size)
-    ci = ComposableImage(img)
-    cropped_img = ci.image(crop_size)
-    assert cropped_img.size == crop_size
-
-
-def test_composable_image_crop_size_greater_than_image_size():
-    img_size = (128, 64)
-    crop_size = (1000, 1000)
-    img = Image.new("RGB", img_size)
-    ci = ComposableImage(img)
-    cropped_img = ci.image(crop_size)
-    assert cropped_img.size == img_size
-
-
-def test_composable_image_crop_offset():
-    img_size = (128, 64)
-    crop_size = (10, 10)
-    img = Image.new("RGB", img_size)
-    ci = ComposableImage(img, offset=(20, 20))
+@pytest.fixture(scope="module")
+def crop_source_image():
+    """
+    A 128x64 source image shared (read-only) by the crop tests.
+    """
+    return Image.new("RGB", (128, 64))
+
+
+@pytest.mark.parametrize("crop_size,offset,expected_size", [
+    # crop size same as the image size
+    ((128, 64), (0, 0), (128, 64)),
+    # crop size smaller than the image size
+    ((10, 10), (0, 0), (10, 10)),
+    # crop size greater than the image size
+    ((1000, 1000), (0, 0), (128, 64)),
+    # crop with an offset into the image
+    ((10, 10), (20, 20), (10, 10)),
+])
+def test_composable_image_crop(crop_source_image, crop_size, offset, expected_size):
+    ci = ComposableImage(crop_source_image, offset=offset)
     cropped_img = ci.image(crop_size)
-    assert cropped_img.size == crop_size
+    assert cropped_img.size == expected_size
 
 
-def test_image_composition_ctor():
-    ic = ImageComposition(dummy())
+def test_image_composition_ctor(device):
+    ic = ImageComposition(device)
     assert isinstance(ic(), PIL.Image.Image)
 
 
-def test_image_add_image_none():
-    ic = ImageComposition(dummy())
+def test_image_add_image_none(device):
+    ic = ImageComposition(device)
     with pytest.raises(AssertionError):
         ic.add_image(None)
 
 
-def test_image_remove_image_none():
-    ic = ImageComposition(dummy())
+def test_image_remove_image_none(device):
+    ic = ImageComposition(device)
     with pytest.raises(AssertionError):
         ic.remove_image(None)
 
 
-def test_image_count():
-    ic = ImageComposition(dummy())
-    img1 = ComposableImage(Image.new("RGB", (1, 1)))
-    img2 = ComposableImage(Image.new("RGB", (1, 1)))
-    img3 = ComposableImage(Image.new("RGB", (1, 1)))
+def test_image_count(device):
+    ic = ImageComposition(device)
+    # ComposableImage never mutates its source, so the three composables
+    # can share a single pixel image
+    pixel = Image.new("RGB", (1, 1))
+    img1 = ComposableImage(pixel)
+    img2 = ComposableImage(pixel)
+    img3 = ComposableImage(pixel)
     ic.add_image(img1)
     ic.add_image(img2)
     ic.add_image(img3)
@@ -118,16 +108,16 @@ def test_image_count():
     assert len(ic.composed_images) == 0
 
 
-def test_refresh_no_images():
-    ic = ImageComposition(dummy())
-    ic_img_before = list(ic().getdata())
+def test_refresh_no_images(device):
+    ic = ImageComposition(device)
+    ic_img_before = ic().tobytes()
     ic.refresh()
-    assert ic_img_before == list(ic().getdata())
+    assert ic_img_before == ic().tobytes()
 
 
-def test_refresh():
-    ic = ImageComposition(dummy())
-    ic_img_before = list(ic().getdata())
+def test_refresh(device):
+    ic = ImageComposition(device)
+    ic_img_before = ic().tobytes()
     img = Image.new("RGB", (25, 25))
     draw = ImageDraw.Draw(img)
     draw.rectangle((10, 10, 20, 20), outline="white")
@@ -135,4 +125,4 @@ def test_refresh():
     ci = ComposableImage(img)
     ic.add_image(ci)
     ic.refresh()
-    assert ic_img_before != list(ic().getdata())
+    assert ic_img_before != ic().tobytes()
@@ -7,7 +7,6 @@
 Tests for the :py:class:`luma.core.legacy.fonts` class.
 """
 
-from PIL import Image
 from luma.core.device import dummy
 from luma.core.render import canvas
 from luma.core.legacy import text, textsize
@@ -15,7 +14,8 @@ import luma.core.legacy.font
 from luma.core.legacy.font import proportional
 
 import pytest
-from helpers import get_reference_image, assert_identical_image
+from helpers import (get_reference_image, load_reference_image,
+    assert_identical_image)
 
 
 charset = ''.join(chr(i) for i in range(256))
@@ -26,13 +26,14 @@ charset = ''.join(chr(i) for i in range(256))
                           "SPECCY_FONT", "LCD_FONT", "UKR_FONT", "TINY_FONT",
                           "SEG7_FONT"])
 def test_font(fontname):
-    font = getattr(luma.core.legacy.font, fontname)
-    w, h = textsize(charset, proportional(font))
+    # Wrap the font once: each proportional lookup trims the glyph bitmap,
+    # so the same wrapper serves both the measuring and the drawing pass
+    font = proportional(getattr(luma.core.legacy.font, fontname))
+    w, h = textsize(charset, font)
     device = dummy(width=w, height=h, mode="1")
     with canvas(device) as draw:
-        text(draw, (0, 0), charset, "white", font=proportional(font))
+        text(draw, (0, 0), charset, "white", font=font)
 
     img_path = get_reference_image(f'{fontname}.png')
-    with open(img_path, 'rb') as fp:
-        reference = Image.open(fp)
-        assert_identical_image(reference, device.image, img_path)
+    reference = load_reference_image(f'{fontname}.png')
+    assert_identical_image(reference, device.image, img_path)
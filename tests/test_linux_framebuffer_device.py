@@ -14,7 +14,7 @@ from luma.core.framebuffer import full_frame
 from luma.core.device import linux_framebuffer
 import luma.core.error
 
-from helpers import multi_mock_open, get_reference_file
+from helpers import multi_mock_open, get_reference_file_bytes
 from unittest.mock import patch, call
 
 WIDTH = 124
@@ -24,10 +24,11 @@ BITS_PER_PIXEL = "24"
 
 
 def swap_red_and_blue(data, step):
+    # Exchange the R and B planes with two strided slice assignments that
+    # run at C speed, rather than looping pixel-by-pixel in Python; the
+    # green (and alpha, when step is 4) bytes are left in place
     arr = bytearray(data)
-    for i in range(0, len(arr), step):
-        [red, green, blue] = arr[i: i + 3]
-        arr[i: i + 3] = [blue, green, red]
+    arr[0::step], arr[2::step] = arr[2::step], arr[0::step]
     return bytes(arr)
 
 
@@ -80,10 +81,9 @@ def test_read_bits_per_pixel():
 ])
 def test_display(bits_per_pixel, bgr):
     bytes_per_pixel = bits_per_pixel // 8
-    with open(get_reference_file(f"fb_{bits_per_pixel}bpp.raw"), "rb") as fp:
-        reference = fp.read()
-        if bgr:
-            reference = swap_red_and_blue(reference, step=bytes_per_pixel)
+    reference = get_reference_file_bytes(f"fb_{bits_per_pixel}bpp.raw")
+    if bgr:
+        reference = swap_red_and_blue(reference, step=bytes_per_pixel)
 
     with patch("builtins.open", multi_mock_open(SCREEN_RES, str(bits_per_pixel), None)) as fake_open:
         device = linux_framebuffer("/dev/fb1", framebuffer=full_frame(), bgr=bgr)
@@ -97,14 +97,14 @@ def test_display(bits_per_pixel, bgr):
             draw.rectangle((0, 32, 64, 64), fill="orange")
             draw.rectangle((64, 32, 128, 64), fill="white")
 
-        fake_open.return_value.seek.assert_has_calls([
-            call(n * WIDTH * bytes_per_pixel)
-            for n in range(HEIGHT)
-        ])
-        fake_open.return_value.write.assert_has_calls([
-            call(reference[n:n + (WIDTH * bytes_per_pixel)])
-            for n in range(0, len(reference), WIDTH * bytes_per_pixel)
-        ])
+        # A full-frame redraw spans the framebuffer's full width, so it
+        # arrives as a single seek to the origin; comparing the writes
+        # concatenated is one memcmp against the reference regardless of
+        # how the frame was segmented, and shows the full diff on failure
+        assert fake_open.return_value.seek.call_args_list == [call(0)]
+        written = b"".join(
+            c.args[0] for c in fake_open.return_value.write.call_args_list)
+        assert written == reference
         fake_open.return_value.flush.assert_called_once()
 
 
@@ -32,7 +32,7 @@ def setup_function(function):
 
 
 def test_data():
-    eight_to_four = lambda data: [f(x) for x in data for f in (lambda x: x >> 4, lambda x: 0x0F & x)]
+    eight_to_four = lambda data: [b for x in data for b in (x >> 4, 0x0F & x)]
 
     data = (0x41, 0x42, 0x43)  # ABC
     serial = bitbang_6800(gpio=gpio, RS=7, E=8, PINS=[25, 24, 23, 18])
@@ -44,7 +44,7 @@ def test_data():
         [call(gpio.PINS[i], gpio.OUT) for i in range(4)]
     prewrite = lambda mode: [call(gpio.RS, mode), call(gpio.E, gpio.LOW)]
     pulse = [call(gpio.E, gpio.HIGH), call(gpio.E, gpio.LOW)]
-    send = lambda v: [call(gpio.PINS[i], (v >> i) & 0x01) for i in range(serial._datalines)]
+    send = lambda v: [call(gpio.PINS, [(v >> i) & 0x01 for i in range(serial._datalines)])]
 
     calls = \
         prewrite(gpio.CMD) + send(0x08) + pulse + send(0x00) + pulse + \
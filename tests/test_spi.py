@@ -7,38 +7,25 @@
 Tests for the :py:class:`luma.core.interface.serial.spi` class.
 """
 
+import errno
 import pytest
 from unittest.mock import Mock, call
 
 from luma.core.interface.serial import spi
 import luma.core.error
 
-from helpers import get_spidev, rpi_gpio_missing, fib, assert_only_cleans_whats_setup
+from helpers import (rpi_gpio_missing, FIB100, SPIDEV_SPEC,
+    assert_only_cleans_whats_setup)
 
 
-spidev = Mock(unsafe=True)
-gpio = Mock(unsafe=True)
-
-
-def setup_function(function):
-    spidev.reset_mock()
-    gpio.reset_mock()
-    gpio.BCM = 1
-    gpio.RST = 2
-    gpio.DC = 3
-    gpio.OUT = 4
-    gpio.HIGH = 5
-    gpio.LOW = 6
-
-
-def verify_spi_init(port, device, bus_speed_hz=8000000, dc=24, rst=25):
+def verify_spi_init(spidev, gpio, port, device, bus_speed_hz=8000000, dc=24, rst=25):
     spidev.open.assert_called_once_with(port, device)
     assert spidev.max_speed_hz == bus_speed_hz
     gpio.setmode.assert_not_called()
     gpio.setup.assert_has_calls([call(dc, gpio.OUT), call(rst, gpio.OUT)])
 
 
-def test_init():
+def test_init(spidev, gpio):
     port = 5
     device = 2
     bus_speed = 16000000
@@ -47,54 +34,56 @@ def test_init():
 
     spi(gpio=gpio, spi=spidev, port=port, device=device, bus_speed_hz=16000000,
         gpio_DC=dc, gpio_RST=rst)
-    verify_spi_init(port, device, bus_speed, dc, rst)
+    verify_spi_init(spidev, gpio, port, device, bus_speed, dc, rst)
     gpio.output.assert_has_calls([
         call(rst, gpio.LOW),
         call(rst, gpio.HIGH)
     ])
 
 
-def test_init_invalid_bus_speed():
+def test_init_invalid_bus_speed(spidev, gpio):
     with pytest.raises(AssertionError):
         spi(gpio=gpio, spi=spidev, port=5, device=2, bus_speed_hz=942312)
 
 
-def test_command():
+def test_command(spidev, gpio):
     cmds = [3, 1, 4, 2]
     serial = spi(gpio=gpio, spi=spidev, port=9, device=1)
     serial.command(*cmds)
-    verify_spi_init(9, 1)
+    verify_spi_init(spidev, gpio, 9, 1)
     gpio.output.assert_has_calls([call(25, gpio.HIGH), call(24, gpio.LOW)])
     spidev.writebytes.assert_called_once_with(cmds)
 
 
-def test_data():
-    data = list(fib(100))
+def test_data(spidev, gpio):
+    data = FIB100
     serial = spi(gpio=gpio, spi=spidev, port=9, device=1)
     serial.data(data)
-    verify_spi_init(9, 1)
+    verify_spi_init(spidev, gpio, 9, 1)
     gpio.output.assert_has_calls([call(25, gpio.HIGH), call(24, gpio.HIGH)])
     spidev.writebytes.assert_called_once_with(data)
 
 
-def test_cleanup():
+def test_cleanup(spidev, gpio):
     serial = spi(gpio=gpio, spi=spidev, port=9, device=1)
     serial._managed = True
     serial.cleanup()
-    verify_spi_init(9, 1)
+    verify_spi_init(spidev, gpio, 9, 1)
     spidev.close.assert_called_once_with()
     assert_only_cleans_whats_setup(gpio)
 
 
-def test_init_device_not_found():
-    spidev = get_spidev()
-    port = 1234
+def test_init_device_not_found(gpio):
+    # A mock device whose open() fails like a missing /dev/spidev node:
+    # no real spidev import or filesystem probe needed
+    missing = Mock(spec_set=SPIDEV_SPEC)
+    missing.open.side_effect = FileNotFoundError(errno.ENOENT, 'No such file or directory')
     with pytest.raises(luma.core.error.DeviceNotFoundError) as ex:
-        spi(gpio=gpio, spi=spidev.SpiDev(), port=port)
+        spi(gpio=gpio, spi=missing, port=1234)
     assert str(ex.value) == 'SPI device not found'
 
 
-def test_unsupported_gpio_platform():
+def test_unsupported_gpio_platform(spidev):
     try:
         spi(spi=spidev, port=9, device=1)
     except luma.core.error.UnsupportedPlatform as ex:
@@ -103,7 +92,7 @@ def test_unsupported_gpio_platform():
         pytest.skip(rpi_gpio_missing)
 
 
-def test_cs_high_ignored():
+def test_cs_high_ignored(spidev, gpio):
     with pytest.warns(RuntimeWarning) as record:
         spi(gpio=gpio, spi=spidev, port=9, device=1, cs_high=True)
 